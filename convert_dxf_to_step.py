@@ -6,8 +6,15 @@ Converts the existing DXF file to STEP format using available conversion methods
 
 import os
 import sys
+import shutil
 import subprocess
+import functools
+import hashlib
 
+# FreeCAD modules (FreeCAD, Import, Part), imported once by _load_freecad
+_freecad_modules = None
+
+@functools.lru_cache(maxsize=1)
 def check_freecad_availability():
     """Check if FreeCAD is available for conversion."""
     try:
@@ -16,23 +23,20 @@ def check_freecad_availability():
     except ImportError:
         return False
 
-def check_opencascade_availability():
-    """Check if OpenCASCADE Python bindings are available."""
-    try:
-        import OCC
-        return True
-    except ImportError:
-        try:
-            import occwl
-            return True
-        except ImportError:
-            return False
+def _load_freecad():
+    """Import the FreeCAD modules on first use and reuse them afterwards."""
+    global _freecad_modules
+    if _freecad_modules is None:
+        import FreeCAD
+        import Import
+        import Part
+        _freecad_modules = (FreeCAD, Import, Part)
+    return _freecad_modules
 
 def convert_with_freecad(dxf_file, step_file):
     """Convert DXF to STEP using FreeCAD."""
     try:
-        import FreeCAD
-        import Import
+        FreeCAD, Import, Part = _load_freecad()
         
         print("Using FreeCAD for conversion...")
         
@@ -56,7 +60,6 @@ def convert_with_freecad(dxf_file, step_file):
                 shapes.append(obj.Shape)
         
         if shapes:
-            import Part
             compound = Part.makeCompound(shapes)
             
             # Export to STEP
@@ -86,7 +89,7 @@ def convert_with_external_tools():
     ]
     
     for tool in tools_to_try:
-        if subprocess.run(["which", tool], capture_output=True).returncode == 0:
+        if shutil.which(tool) is not None:
             print(f"Found external tool: {tool}")
             # Tool-specific conversion logic would go here
             return False  # Not implemented yet
@@ -120,6 +123,36 @@ def create_step_using_native_generator():
         print("Native STEP generator not found")
         return False
 
+def file_sha256(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def conversion_hash_file(step_file):
+    """Sidecar file recording the DXF hash a STEP file was produced from."""
+    directory, name = os.path.split(step_file)
+    return os.path.join(directory, f".{name}.hash")
+
+def is_conversion_cached(dxf_hash, step_file):
+    """Check if step_file exists and was produced from a DXF with this hash."""
+    hash_file = conversion_hash_file(step_file)
+    if not os.path.exists(step_file) or not os.path.exists(hash_file):
+        return False
+    
+    with open(hash_file) as f:
+        return f.read().strip() == dxf_hash
+
+def save_conversion_hash(dxf_hash, step_file):
+    """Record the DXF hash next to a STEP file converted from that DXF."""
+    with open(conversion_hash_file(step_file), 'w') as f:
+        f.write(dxf_hash)
+
+def clear_conversion_hash(step_file):
+    """Forget the recorded DXF hash once step_file was written without reading the DXF."""
+    hash_file = conversion_hash_file(step_file)
+    if os.path.exists(hash_file):
+        os.remove(hash_file)
+
 def main():
     """Main conversion function."""
     
@@ -139,19 +172,28 @@ def main():
     print(f"Output file: {step_file}")
     print()
     
+    # Skip conversion if the STEP file was already produced from this exact DXF
+    dxf_hash = file_sha256(dxf_file)
+    if is_conversion_cached(dxf_hash, step_file):
+        print("✓ STEP file is up to date with the DXF file (cached), skipping conversion")
+        return True
+    
     # Try different conversion methods in order of preference
     
     # Method 1: Use FreeCAD if available
     if check_freecad_availability():
         print("Method 1: Trying FreeCAD conversion...")
         if convert_with_freecad(dxf_file, step_file):
+            save_conversion_hash(dxf_hash, step_file)
             return True
         print("FreeCAD conversion failed, trying next method...")
         print()
     
-    # Method 2: Use native STEP generator
+    # Method 2: Use native STEP generator. It builds the frame itself rather than
+    # reading the DXF, so its output is never cached against the DXF hash
     print("Method 2: Trying native STEP generator...")
     if create_step_using_native_generator():
+        clear_conversion_hash(step_file)
         return True
     print("Native STEP generator failed, trying next method...")
     print()
@@ -159,6 +201,7 @@ def main():
     # Method 3: Try external tools
     print("Method 3: Trying external conversion tools...")
     if convert_with_external_tools():
+        save_conversion_hash(dxf_hash, step_file)
         return True
     print("External tools not available or failed...")
     print()
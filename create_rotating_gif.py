@@ -4,136 +4,166 @@ Create a rotating 3D GIF of the stainless steel marine davit support frame
 For use in README and documentation
 """
 
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba_array
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import numpy as np
-import math
+import functools
 from PIL import Image
-import io
+import multiprocessing
 import os
+import shutil
+import subprocess
 
-def create_frame_visualization_for_gif(azim_angle):
-    """Create a 3D visualization of the frame at a specific rotation angle."""
-    
-    # Frame specifications (matching the updated design)
-    VERTICAL_HEIGHT = 30.5
-    HORIZONTAL_LENGTH = 24.125
-    
-    # Tube specifications
-    MAIN_TUBE_DIAMETER = 1.375
-    MAIN_TUBE_RADIUS = MAIN_TUBE_DIAMETER / 2.0
-    
-    BRACE_TUBE_DIAMETER = 1.125
-    BRACE_TUBE_RADIUS = BRACE_TUBE_DIAMETER / 2.0
-    
-    # Position specifications - UPDATED TO 5"
-    BOTTOM_HORIZONTAL_HEIGHT = 5.0
-    TOP_HORIZONTAL_HEIGHT = VERTICAL_HEIGHT
-    BRACE_LENGTH = 12.0
-    
-    # Support bar specifications
-    SUPPORT_BAR_LENGTH = 6.0
-    SUPPORT_BAR_ATTACHMENT_HEIGHT = 14.0  # 8" above bottom rail (14" from ground)
-    SUPPORT_BAR_PLATE_HEIGHT = BOTTOM_HORIZONTAL_HEIGHT  # At bottom rail height (5")
-    SUPPORT_BAR_DISTANCE = 3.0  # Distance from vertical tube center
-    
-    # Mounting plate specifications
-    PLATE_WIDTH = 3.0
-    PLATE_HEIGHT = 2.0
-    PLATE_THICKNESS = 0.5
-    
-    # Create figure and 3D axis
-    fig = plt.figure(figsize=(10, 8))
+# Frame specifications (matching the updated design)
+VERTICAL_HEIGHT = 30.5
+HORIZONTAL_LENGTH = 24.125
+
+# Tube specifications
+MAIN_TUBE_DIAMETER = 1.375
+MAIN_TUBE_RADIUS = MAIN_TUBE_DIAMETER / 2.0
+
+BRACE_TUBE_DIAMETER = 1.125
+BRACE_TUBE_RADIUS = BRACE_TUBE_DIAMETER / 2.0
+
+# Position specifications - UPDATED TO 5"
+BOTTOM_HORIZONTAL_HEIGHT = 5.0
+TOP_HORIZONTAL_HEIGHT = VERTICAL_HEIGHT
+BRACE_LENGTH = 12.0
+
+# Support bar specifications
+SUPPORT_BAR_LENGTH = 6.0
+SUPPORT_BAR_ATTACHMENT_HEIGHT = 14.0  # 8" above bottom rail (14" from ground)
+SUPPORT_BAR_PLATE_HEIGHT = BOTTOM_HORIZONTAL_HEIGHT  # At bottom rail height (5")
+SUPPORT_BAR_DISTANCE = 3.0  # Distance from vertical tube center
+
+# Mounting plate specifications
+PLATE_WIDTH = 3.0
+PLATE_HEIGHT = 2.0
+PLATE_THICKNESS = 0.5
+
+# Ring specifications
+RING_RADIUS = 1.5
+RING_HEIGHT = 27.5
+
+# Static geometry, precomputed once since it does not depend on the view angle
+_INV_SQRT2 = 0.7071067811865476  # cos(45°), for the corner braces
+_BRACE_OFFSET = BRACE_LENGTH * _INV_SQRT2
+
+_LEFT_BOT = np.array([0, 0, 0])
+_RIGHT_BOT = np.array([HORIZONTAL_LENGTH, 0, 0])
+_LEFT_TOP = np.array([0, 0, VERTICAL_HEIGHT])
+_RIGHT_TOP = np.array([HORIZONTAL_LENGTH, 0, VERTICAL_HEIGHT])
+
+_BOT_RAIL_START = np.array([0, 0, BOTTOM_HORIZONTAL_HEIGHT])
+_BOT_RAIL_END = np.array([HORIZONTAL_LENGTH, 0, BOTTOM_HORIZONTAL_HEIGHT])
+_TOP_RAIL_START = np.array([0, 0, TOP_HORIZONTAL_HEIGHT])
+_TOP_RAIL_END = np.array([HORIZONTAL_LENGTH, 0, TOP_HORIZONTAL_HEIGHT])
+
+# Diagonal brace (start, end) pairs: top corners, then bottom corners
+_BRACES = [
+    (np.array([0, 0, TOP_HORIZONTAL_HEIGHT - _BRACE_OFFSET]),
+     np.array([_BRACE_OFFSET, 0, TOP_HORIZONTAL_HEIGHT])),
+    (np.array([HORIZONTAL_LENGTH, 0, TOP_HORIZONTAL_HEIGHT - _BRACE_OFFSET]),
+     np.array([HORIZONTAL_LENGTH - _BRACE_OFFSET, 0, TOP_HORIZONTAL_HEIGHT])),
+    (np.array([0, 0, BOTTOM_HORIZONTAL_HEIGHT + _BRACE_OFFSET]),
+     np.array([_BRACE_OFFSET, 0, BOTTOM_HORIZONTAL_HEIGHT])),
+    (np.array([HORIZONTAL_LENGTH, 0, BOTTOM_HORIZONTAL_HEIGHT + _BRACE_OFFSET]),
+     np.array([HORIZONTAL_LENGTH - _BRACE_OFFSET, 0, BOTTOM_HORIZONTAL_HEIGHT])),
+]
+
+_CLEAT_CENTER = np.array([HORIZONTAL_LENGTH/2, 0, TOP_HORIZONTAL_HEIGHT + 0.2])
+_LEFT_RING_CENTER = np.array([0, 0, RING_HEIGHT])
+_RIGHT_RING_CENTER = np.array([HORIZONTAL_LENGTH, 0, RING_HEIGHT])
+_CENTER_RING_CENTER = np.array([HORIZONTAL_LENGTH/2, 0, TOP_HORIZONTAL_HEIGHT])
+
+# Unit circle table shared by all tube surfaces
+_TUBE_THETA = np.linspace(0, 2*np.pi, 16)
+_TUBE_COS = np.cos(_TUBE_THETA)
+_TUBE_SIN = np.sin(_TUBE_THETA)
+
+# Semicircle arc table shared by all rings
+_SEMI_THETA = np.linspace(0, np.pi, 20)
+_SEMI_COS = np.cos(_SEMI_THETA) * RING_RADIUS
+_SEMI_SIN = np.sin(_SEMI_THETA) * RING_RADIUS
+
+# Title and legend are the same for every frame
+_TITLE = ('316 Stainless Steel Marine Davit Support Frame\n'
+          '30.5"H × 24.125"W - Bottom Rail at 5" Height')
+
+# Legend proxies; the tubes are one compound surface with no per-tube label
+_LEGEND_HANDLES = [
+    Patch(color='red', alpha=0.8, label='Vertical Tubes'),
+    Patch(color='gold', alpha=0.8, label='Horizontal Rails'),
+    Patch(color='green', alpha=0.8, label='Diagonal Braces'),
+    Line2D([], [], color='cyan', linewidth=8, label='Boat Cleat'),
+    Line2D([], [], color='purple', linewidth=6, label='Semicircle Rings'),
+    Line2D([], [], color='purple', linewidth=6, label='Center Ring'),
+    Line2D([], [], color='orange', linewidth=4, label='Support Bars'),
+]
+
+def build_scene():
+    """Build the full frame scene once; the camera angle is set by the caller."""
+    
+    # Create figure and 3D axis on a bare Agg canvas (no pyplot/GUI backend involved)
+    fig = Figure(figsize=(10, 8))
+    FigureCanvasAgg(fig)
+    # Fixed margins instead of a tight bbox, which would cost an extra render per frame
+    fig.subplots_adjust(left=0.05, right=0.95, top=0.92, bottom=0.08)
     ax = fig.add_subplot(111, projection='3d')
     
-    # Set the viewing angle
-    ax.view_init(elev=20, azim=azim_angle)
-    
-    # Define tube positions
-    left_vertical_center = np.array([0, 0, 0])
-    right_vertical_center = np.array([HORIZONTAL_LENGTH, 0, 0])
-    
-    # Create vertical tubes
-    create_tube_3d(ax, left_vertical_center, 
-                   left_vertical_center + np.array([0, 0, VERTICAL_HEIGHT]),
-                   MAIN_TUBE_RADIUS, 'red', 'Vertical Tubes')
-    
-    create_tube_3d(ax, right_vertical_center,
-                   right_vertical_center + np.array([0, 0, VERTICAL_HEIGHT]),
-                   MAIN_TUBE_RADIUS, 'red', '')
-    
-    # Create horizontal tubes
-    # Bottom horizontal
-    create_tube_3d(ax, np.array([0, 0, BOTTOM_HORIZONTAL_HEIGHT]),
-                   np.array([HORIZONTAL_LENGTH, 0, BOTTOM_HORIZONTAL_HEIGHT]),
-                   MAIN_TUBE_RADIUS, 'gold', 'Horizontal Rails')
-    
-    # Top horizontal
-    create_tube_3d(ax, np.array([0, 0, TOP_HORIZONTAL_HEIGHT]),
-                   np.array([HORIZONTAL_LENGTH, 0, TOP_HORIZONTAL_HEIGHT]),
-                   MAIN_TUBE_RADIUS, 'gold', '')
-    
-    # Create diagonal braces
-    brace_offset = BRACE_LENGTH / math.sqrt(2)
-    
-    # Top corner braces
-    create_tube_3d(ax, np.array([0, 0, TOP_HORIZONTAL_HEIGHT - brace_offset]),
-                   np.array([brace_offset, 0, TOP_HORIZONTAL_HEIGHT]),
-                   BRACE_TUBE_RADIUS, 'green', 'Diagonal Braces')
-    
-    create_tube_3d(ax, np.array([HORIZONTAL_LENGTH, 0, TOP_HORIZONTAL_HEIGHT - brace_offset]),
-                   np.array([HORIZONTAL_LENGTH - brace_offset, 0, TOP_HORIZONTAL_HEIGHT]),
-                   BRACE_TUBE_RADIUS, 'green', '')
-    
-    # Bottom corner braces
-    create_tube_3d(ax, np.array([0, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset]),
-                   np.array([brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT]),
-                   BRACE_TUBE_RADIUS, 'green', '')
-    
-    create_tube_3d(ax, np.array([HORIZONTAL_LENGTH, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset]),
-                   np.array([HORIZONTAL_LENGTH - brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT]),
-                   BRACE_TUBE_RADIUS, 'green', '')
+    # Create vertical tubes, horizontal tubes and diagonal braces as one compound surface
+    tubes = [
+        (_LEFT_BOT, _LEFT_TOP, MAIN_TUBE_RADIUS, 'red'),
+        (_RIGHT_BOT, _RIGHT_TOP, MAIN_TUBE_RADIUS, 'red'),
+        (_BOT_RAIL_START, _BOT_RAIL_END, MAIN_TUBE_RADIUS, 'gold'),
+        (_TOP_RAIL_START, _TOP_RAIL_END, MAIN_TUBE_RADIUS, 'gold'),
+    ]
+    tubes += [(brace_start, brace_end, BRACE_TUBE_RADIUS, 'green')
+              for brace_start, brace_end in _BRACES]
+    create_tube_collection(ax, tubes)
     
     # Add boat cleat on top center
-    cleat_center = np.array([HORIZONTAL_LENGTH/2, 0, TOP_HORIZONTAL_HEIGHT + 0.2])
-    create_boat_cleat(ax, cleat_center, 'cyan', 'Boat Cleat')
+    create_boat_cleat(ax, _CLEAT_CENTER, 'cyan', 'Boat Cleat')
     
     # Add semicircle rings on vertical tubes (horizontal orientation, properly connected)
-    ring_height = 27.5
-    create_horizontal_semicircle_ring(ax, np.array([0, 0, ring_height]), 'purple', 'Semicircle Rings')
-    create_horizontal_semicircle_ring(ax, np.array([HORIZONTAL_LENGTH, 0, ring_height]), 'purple', '')
+    create_horizontal_semicircle_ring(ax, _LEFT_RING_CENTER, 'purple', 'Semicircle Rings')
+    create_horizontal_semicircle_ring(ax, _RIGHT_RING_CENTER, 'purple', '')
     
     # Add third semicircle in center of top horizontal tube (horizontal orientation)
-    center_ring_position = np.array([HORIZONTAL_LENGTH/2, 0, TOP_HORIZONTAL_HEIGHT])
-    create_center_horizontal_semicircle_ring(ax, center_ring_position, 'purple', 'Center Ring')
+    create_center_horizontal_semicircle_ring(ax, _CENTER_RING_CENTER, 'purple', 'Center Ring')
     
     # Add angled support bars with mounting plates
-    create_support_bar_system(ax, left_vertical_center, SUPPORT_BAR_ATTACHMENT_HEIGHT, 
-                             SUPPORT_BAR_PLATE_HEIGHT, SUPPORT_BAR_DISTANCE, SUPPORT_BAR_LENGTH,
-                             PLATE_WIDTH, PLATE_HEIGHT, PLATE_THICKNESS, 'orange', 'Support Bars')
+    left_holes = create_support_bar_system(ax, _LEFT_BOT, SUPPORT_BAR_ATTACHMENT_HEIGHT, 
+                                          SUPPORT_BAR_PLATE_HEIGHT, SUPPORT_BAR_DISTANCE, SUPPORT_BAR_LENGTH,
+                                          PLATE_WIDTH, PLATE_HEIGHT, PLATE_THICKNESS, 'orange', 'Support Bars')
     
-    create_support_bar_system(ax, right_vertical_center, SUPPORT_BAR_ATTACHMENT_HEIGHT, 
-                             SUPPORT_BAR_PLATE_HEIGHT, SUPPORT_BAR_DISTANCE, SUPPORT_BAR_LENGTH,
-                             PLATE_WIDTH, PLATE_HEIGHT, PLATE_THICKNESS, 'orange', '')
+    right_holes = create_support_bar_system(ax, _RIGHT_BOT, SUPPORT_BAR_ATTACHMENT_HEIGHT, 
+                                           SUPPORT_BAR_PLATE_HEIGHT, SUPPORT_BAR_DISTANCE, SUPPORT_BAR_LENGTH,
+                                           PLATE_WIDTH, PLATE_HEIGHT, PLATE_THICKNESS, 'orange', '')
+    
+    # Add bolt holes for both mounting plates in one scatter
+    holes = np.array(left_holes + right_holes)
+    ax.scatter(holes[:,0], holes[:,1], holes[:,2], color='black', s=20)
     
     # Set axis properties
     ax.set_xlabel('Length (inches)')
     ax.set_ylabel('Width (inches)')
     ax.set_zlabel('Height (inches)')
     
-    # Set equal aspect ratio and limits
-    max_range = max(HORIZONTAL_LENGTH, VERTICAL_HEIGHT) * 0.6
+    # Set limits
     ax.set_xlim([-8, HORIZONTAL_LENGTH + 8])  # Extended to show support bars
     ax.set_ylim([-10, 10])
     ax.set_zlim([0, VERTICAL_HEIGHT + 5])
     
     # Add title
-    ax.set_title('316 Stainless Steel Marine Davit Support Frame\n' +
-                f'30.5"H × 24.125"W - Bottom Rail at 5" Height',
-                fontsize=12, fontweight='bold')
+    ax.set_title(_TITLE, fontsize=12, fontweight='bold')
     
     # Add legend
-    ax.legend(loc='upper left', bbox_to_anchor=(0, 1))
+    ax.legend(handles=_LEGEND_HANDLES, loc='upper left', bbox_to_anchor=(0, 1))
     
     # Remove background and make it clean
     ax.xaxis.pane.fill = False
@@ -141,16 +171,38 @@ def create_frame_visualization_for_gif(azim_angle):
     ax.zaxis.pane.fill = False
     ax.grid(True, alpha=0.3)
     
-    return fig
+    return fig, ax
+
+def create_tube_collection(ax, tubes):
+    """Draw all tubes as a single shaded 3D polygon collection.
+    
+    tubes is a list of (start_point, end_point, radius, color) tuples.
+    """
+    quads = []
+    colors = []
+    for start_point, end_point, radius, color in tubes:
+        tube_quads = _compute_tube_quads(tuple(start_point), tuple(end_point), radius)
+        if tube_quads is None:
+            continue
+        quads.append(tube_quads)
+        colors.extend([color] * len(tube_quads))
+    
+    all_quads = np.concatenate(quads)
+    ax.add_collection3d(Poly3DCollection(all_quads, facecolors=to_rgba_array(colors),
+                                         shade=True, alpha=0.8))
 
-def create_tube_3d(ax, start_point, end_point, radius, color, label):
-    """Create a 3D tube visualization."""
+@functools.lru_cache(maxsize=64)
+def _compute_tube_quads(start_point, end_point, radius):
+    """Compute the tube surface quads; cached since they are independent of the view angle."""
+    start_point = np.array(start_point, dtype=float)
+    end_point = np.array(end_point, dtype=float)
+    
     # Calculate direction vector
     direction = end_point - start_point
     length = np.linalg.norm(direction)
     
     if length == 0:
-        return
+        return None
     
     direction = direction / length
     
@@ -163,26 +215,18 @@ def create_tube_3d(ax, start_point, end_point, radius, color, label):
     
     perp2 = np.cross(direction, perp1)
     
-    # Create cylinder
-    theta = np.linspace(0, 2*np.pi, 16)
-    z_line = np.linspace(0, length, 20)
-    
-    # Create surface
-    theta_mesh, z_mesh = np.meshgrid(theta, z_line)
-    x_mesh = radius * np.cos(theta_mesh)
-    y_mesh = radius * np.sin(theta_mesh)
+    # Create cylinder surface by broadcasting the shared unit circle along the axis
+    ring = radius * (np.outer(_TUBE_COS, perp1) + np.outer(_TUBE_SIN, perp2))
+    points = start_point + _tube_z_line(length)[:, None, None] * direction + ring
     
-    # Transform to world coordinates
-    points = np.zeros((x_mesh.shape[0], x_mesh.shape[1], 3))
-    for i in range(x_mesh.shape[0]):
-        for j in range(x_mesh.shape[1]):
-            local_point = np.array([x_mesh[i,j], y_mesh[i,j], z_mesh[i,j]])
-            world_point = start_point + z_mesh[i,j] * direction + local_point[0] * perp1 + local_point[1] * perp2
-            points[i,j] = world_point
-    
-    # Plot surface
-    ax.plot_surface(points[:,:,0], points[:,:,1], points[:,:,2], 
-                   color=color, alpha=0.8, label=label if label else None)
+    # Split the grid into quads, wound the same way plot_surface does
+    return np.stack([points[:-1, :-1], points[:-1, 1:],
+                     points[1:, 1:], points[1:, :-1]], axis=2).reshape(-1, 4, 3)
+
+@functools.lru_cache(maxsize=16)
+def _tube_z_line(length):
+    """Axial sample positions along a tube; the frame only has a few distinct lengths."""
+    return np.linspace(0, length, 20)
 
 def create_boat_cleat(ax, center, color, label):
     """Create a simple boat cleat representation."""
@@ -202,30 +246,39 @@ def create_boat_cleat(ax, center, color, label):
 
 def create_horizontal_semicircle_ring(ax, center, color, label):
     """Create a horizontal semicircle ring representation."""
-    ring_radius = 1.5
-    theta = np.linspace(0, np.pi, 20)  # Semicircle
-    
+    x, y, z = _compute_horizontal_semicircle(tuple(center))
+    ax.plot(x, y, z, color=color, linewidth=6, label=label if label else None)
+
+@functools.lru_cache(maxsize=16)
+def _compute_horizontal_semicircle(center):
+    """Compute the arc points for a ring on a vertical tube."""
     # Create semicircle in XZ plane (horizontal, extending from sides of vertical tube)
-    x = center[0] + ring_radius * np.cos(theta)
-    y = np.full_like(theta, center[1])
-    z = center[2] + ring_radius * np.sin(theta)
+    x = center[0] + _SEMI_COS
+    y = np.full_like(_SEMI_THETA, center[1])
+    z = center[2] + _SEMI_SIN
     
-    ax.plot(x, y, z, color=color, linewidth=6, label=label if label else None)
+    return x, y, z
 
 def create_center_horizontal_semicircle_ring(ax, center, color, label):
     """Create a center horizontal semicircle ring representation."""
-    ring_radius = 1.5
-    theta = np.linspace(0, np.pi, 20)  # Semicircle
-    
+    x, y, z = _compute_center_horizontal_semicircle(tuple(center))
+    ax.plot(x, y, z, color=color, linewidth=6, label=label if label else None)
+
+@functools.lru_cache(maxsize=16)
+def _compute_center_horizontal_semicircle(center):
+    """Compute the arc points for the ring lying on the top tube."""
     # Create semicircle in XY plane (horizontal, lying flat on top tube)
-    x = center[0] + ring_radius * np.cos(theta)
-    y = center[1] + ring_radius * np.sin(theta)
-    z = np.full_like(theta, center[2])
+    x = center[0] + _SEMI_COS
+    y = center[1] + _SEMI_SIN
+    z = np.full_like(_SEMI_THETA, center[2])
     
-    ax.plot(x, y, z, color=color, linewidth=6, label=label if label else None)
+    return x, y, z
 
 def create_support_bar_system(ax, tube_center, attachment_height, plate_height, distance, length, plate_width, plate_height_param, plate_thickness, color, label):
-    """Create a support bar system with mounting plates."""
+    """Create a support bar system with mounting plates.
+    
+    Returns the bolt hole positions so the caller can draw all holes in one scatter.
+    """
     # Calculate angled support bar positions
     attachment_point = tube_center + np.array([0, 0, attachment_height])
     plate_center = tube_center + np.array([distance, 0, plate_height])  # 3" away from tube, at bottom rail height
@@ -261,8 +314,51 @@ def create_support_bar_system(ax, tube_center, attachment_height, plate_height,
         plate_center + np.array([-hole_spacing/2, hole_spacing/2, 0.1])
     ]
     
-    for hole_pos in hole_positions:
-        ax.scatter(hole_pos[0], hole_pos[1], hole_pos[2], color='black', s=20)
+    return hole_positions
+
+# Scene owned by each render worker process, built once by _init_render_worker
+_worker_scene = None
+
+def _init_render_worker():
+    """Build one scene per worker process so it is reused for every frame it renders."""
+    global _worker_scene
+    fig, ax = build_scene()
+    fig.set_dpi(80)  # Reduced from 100 to 80 DPI for smaller file size
+    _worker_scene = (fig, ax)
+
+def _render_frame(azim_angle, palette=None):
+    """Render the scene at one angle and return the raw bytes and image size.
+    
+    The bytes are RGB, or P-mode indices into palette (a flat RGB list) when one is given.
+    """
+    fig, ax = _worker_scene
+    
+    # Rotate the view and render straight from the canvas buffer
+    ax.view_init(elev=20, azim=azim_angle)
+    fig.canvas.draw()
+    img = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+    
+    # Quantize here so frames are mapped onto the shared palette in parallel
+    if palette is not None:
+        palette_image = Image.new('P', (1, 1))
+        palette_image.putpalette(palette)
+        img = img.quantize(palette=palette_image, dither=Image.Dither.NONE)
+    return img.tobytes(), img.size
+
+def optimize_with_gifsicle(gif_filename):
+    """Optimize the GIF in place with gifsicle, if it is installed."""
+    gifsicle = shutil.which("gifsicle")
+    if gifsicle is None:
+        return False
+    
+    result = subprocess.run([gifsicle, "--batch", "-O3", gif_filename],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Note: gifsicle optimization failed: {result.stderr.strip()}")
+        return False
+    
+    print("✓ GIF optimized with gifsicle")
+    return True
 
 def create_rotating_gif():
     """Create a rotating GIF of the 3D frame."""
@@ -270,43 +366,59 @@ def create_rotating_gif():
     print("Creating rotating 3D GIF of the stainless steel frame...")
     
     # Create frames for the GIF
-    frames = []
     num_frames = 24  # 24 frames = 15 degree increments for full rotation
+    angles = np.linspace(0, 360, num_frames, endpoint=False)  # Rotate 360 degrees
     
-    for i in range(num_frames):
-        azim_angle = i * (360 / num_frames)  # Rotate 360 degrees
-        print(f"Generating frame {i+1}/{num_frames} (angle: {azim_angle:.1f}°)")
-        
-        # Create the plot
-        fig = create_frame_visualization_for_gif(azim_angle)
+    # Frames only depend on the angle, so render them in parallel
+    processes = min(os.cpu_count() or 1, num_frames)
+    print(f"Generating {num_frames} frames using {processes} process(es)...")
+    gif_filename = "frame_3d_rotation.gif"
+    with multiprocessing.Pool(processes=processes, initializer=_init_render_worker) as pool:
+        # Render the frames a quarter turn apart first and build one shared palette
+        # from a strip of them, so it holds the shading seen from every side
+        # (e.g. the braces' greens)
+        sample_step = num_frames // 4
+        samples = {}
+        for i, (data, size) in zip(range(0, num_frames, sample_step),
+                                   pool.map(_render_frame, angles[::sample_step])):
+            samples[i] = Image.frombytes('RGB', size, data)
+        width, height = samples[0].size
+        strip = Image.new('RGB', (width, height * len(samples)))
+        for row, frame in enumerate(samples.values()):
+            strip.paste(frame, (0, height * row))
+        palette = strip.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
         
-        # Save to memory buffer with reduced DPI for smaller file size
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=80, bbox_inches='tight',  # Reduced from 100 to 80 DPI
-                   facecolor='white', edgecolor='none')
+        # Stream the remaining angles, quantized by the workers; imap hands them back
+        # in order as they finish, so besides the samples only the frame being
+        # encoded is held in memory
+        palette_values = palette.getpalette()
+        rest = pool.imap(functools.partial(_render_frame, palette=palette_values),
+                         [angle for i, angle in enumerate(angles) if i % sample_step])
         
-        # Convert to PIL Image
-        buf.seek(0)
-        img = Image.open(buf)
-        # Make a copy to avoid issues with buffer closing
-        img_copy = img.copy()
-        frames.append(img_copy)
+        def quantized_frames():
+            for i in range(num_frames):
+                if i in samples:
+                    yield samples.pop(i).quantize(palette=palette, dither=Image.Dither.NONE)
+                else:
+                    data, size = next(rest)
+                    frame = Image.frombytes('P', size, data)
+                    frame.putpalette(palette_values)
+                    yield frame
         
-        # Close the figure and buffer
-        plt.close(fig)
-        img.close()
-        buf.close()
-    
-    # Save as GIF with optimized settings
-    gif_filename = "frame_3d_rotation.gif"
-    frames[0].save(
-        gif_filename,
-        save_all=True,
-        append_images=frames[1:],
-        duration=200,  # 200ms per frame for smaller file
-        loop=0,  # Loop forever
-        optimize=True  # Enable optimization for smaller file size
-    )
+        # Save as GIF, pulling frames through as they are rendered; frames already
+        # share a palette so no extra optimize pass is needed
+        frames = quantized_frames()
+        next(frames).save(
+            gif_filename,
+            save_all=True,
+            append_images=frames,
+            duration=200,  # 200ms per frame for smaller file
+            loop=0,  # Loop forever
+            optimize=False
+        )
+    
+    # Let gifsicle do inter-frame optimization in C when it is available
+    optimize_with_gifsicle(gif_filename)
     
     print(f"✓ Rotating GIF saved as: {gif_filename}")
     print(f"✓ GIF contains {num_frames} frames with 360° rotation")
@@ -14,8 +14,48 @@ Final Specifications:
 """
 
 import ezdxf
-import math
-from ezdxf.math import Vec3
+import argparse
+import functools
+import sys
+import numpy as np
+from ezdxf.math import Vec3, Matrix44
+from ezdxf.render import MeshBuilder, forms
+
+# Frame specifications (all dimensions in inches)
+VERTICAL_HEIGHT = 30.5
+HORIZONTAL_LENGTH = 24.125
+BOTTOM_HORIZONTAL_HEIGHT = 5.0  # Height from bottom
+TOP_HORIZONTAL_HEIGHT = VERTICAL_HEIGHT  # At the top
+BRACE_LENGTH = 12.0  # Length of diagonal braces
+
+# Spacing between vertical tubes (center to center)
+VERTICAL_SPACING = HORIZONTAL_LENGTH
+
+# Facets per tube cross-section. The DXF tubes are visual aids for fabrication
+# rather than exact geometry, and 8 sides read as round at 1-1.5" OD while
+# halving the face count of a 16-sided tube; raise it for smoother renders
+TUBE_SEGMENTS = 8
+
+_INV_SQRT2 = 0.7071067811865476  # cos(45°), for the corner braces
+
+# For 12" braces at 45 degrees, the horizontal and vertical components are each 12/√2 ≈ 8.485"
+_BRACE_OFFSET = BRACE_LENGTH * _INV_SQRT2
+
+# Corner brace (start, end) points; each brace runs from a vertical tube to a horizontal tube
+_BRACE_ENDPOINTS = (
+    # Left top: from left vertical below top rail to a point on the top horizontal
+    ((0.0, 0.0, TOP_HORIZONTAL_HEIGHT - _BRACE_OFFSET), (_BRACE_OFFSET, 0.0, TOP_HORIZONTAL_HEIGHT)),
+    # Right top: from right vertical below top rail to a point on the top horizontal
+    ((VERTICAL_SPACING, 0.0, TOP_HORIZONTAL_HEIGHT - _BRACE_OFFSET), (VERTICAL_SPACING - _BRACE_OFFSET, 0.0, TOP_HORIZONTAL_HEIGHT)),
+    # Left bottom: from left vertical above bottom rail to a point on the bottom horizontal
+    ((0.0, 0.0, BOTTOM_HORIZONTAL_HEIGHT + _BRACE_OFFSET), (_BRACE_OFFSET, 0.0, BOTTOM_HORIZONTAL_HEIGHT)),
+    # Right bottom: from right vertical above bottom rail to a point on the bottom horizontal
+    ((VERTICAL_SPACING, 0.0, BOTTOM_HORIZONTAL_HEIGHT + _BRACE_OFFSET), (VERTICAL_SPACING - _BRACE_OFFSET, 0.0, BOTTOM_HORIZONTAL_HEIGHT)),
+)
+
+# (direction, perp1, perp2) basis per rounded tube direction; the frame only
+# has a few distinct tube orientations
+_ORIENT_BASIS = {}
 
 def create_metal_frame_dxf():
     """Create a 3D DXF file for the marine davit support frame fabrication."""
@@ -25,15 +65,10 @@ def create_metal_frame_dxf():
     msp = doc.modelspace()
     
     # Frame specifications (all dimensions in inches) - UPDATED TO FINAL SPECS
-    VERTICAL_HEIGHT = 30.5
-    HORIZONTAL_LENGTH = 24.125
     MAIN_TUBE_DIAMETER = 1.375
     MAIN_TUBE_RADIUS = MAIN_TUBE_DIAMETER / 2.0
     BRACE_TUBE_DIAMETER = 1.125
     BRACE_TUBE_RADIUS = BRACE_TUBE_DIAMETER / 2.0
-    BOTTOM_HORIZONTAL_HEIGHT = 5.0  # UPDATED: Height from bottom (was 12", now 5")
-    TOP_HORIZONTAL_HEIGHT = VERTICAL_HEIGHT  # At the top
-    BRACE_LENGTH = 12.0  # Length of diagonal braces
     
     # Boat cleat specifications
     CLEAT_LENGTH = 6.0  # 6" low-profile flat deck cleat
@@ -59,9 +94,6 @@ def create_metal_frame_dxf():
     BOLT_HOLE_DIAMETER = 0.5
     BOLT_HOLE_SPACING = 1.0
     
-    # Spacing between vertical tubes (center to center)
-    VERTICAL_SPACING = HORIZONTAL_LENGTH
-    
     # Define colors for different components
     VERTICAL_COLOR = 1  # Red
     HORIZONTAL_COLOR = 2  # Yellow
@@ -76,98 +108,41 @@ def create_metal_frame_dxf():
     
     # Position coordinates for the frame
     # Left vertical tube center
-    left_vertical_center = Vec3(0, 0, 0)
+    left_vertical_center = (0.0, 0.0, 0.0)
     # Right vertical tube center  
-    right_vertical_center = Vec3(VERTICAL_SPACING, 0, 0)
+    right_vertical_center = (VERTICAL_SPACING, 0.0, 0.0)
+    
+    # Collect every tube as (start_point, end_point, radius, layer) with plain
+    # (x, y, z) tuples; they are built together in one batch below
+    tubes = []
     
     # Create vertical tubes as 3D solids
     # Left vertical tube
-    create_tube_solid(msp, 
-                     start_point=left_vertical_center,
-                     end_point=left_vertical_center + Vec3(0, 0, VERTICAL_HEIGHT),
-                     radius=MAIN_TUBE_RADIUS,
-                     layer='VERTICAL_TUBES')
+    tubes.append((left_vertical_center, (0.0, 0.0, VERTICAL_HEIGHT), MAIN_TUBE_RADIUS, 'VERTICAL_TUBES'))
     
     # Right vertical tube
-    create_tube_solid(msp,
-                     start_point=right_vertical_center,
-                     end_point=right_vertical_center + Vec3(0, 0, VERTICAL_HEIGHT),
-                     radius=MAIN_TUBE_RADIUS,
-                     layer='VERTICAL_TUBES')
+    tubes.append((right_vertical_center, (VERTICAL_SPACING, 0.0, VERTICAL_HEIGHT), MAIN_TUBE_RADIUS, 'VERTICAL_TUBES'))
     
     # Create horizontal tubes as 3D solids
     # Bottom horizontal tube (5" from bottom)
-    bottom_horizontal_start = Vec3(0, 0, BOTTOM_HORIZONTAL_HEIGHT)
-    bottom_horizontal_end = Vec3(VERTICAL_SPACING, 0, BOTTOM_HORIZONTAL_HEIGHT)
+    bottom_horizontal_start = (0.0, 0.0, BOTTOM_HORIZONTAL_HEIGHT)
+    bottom_horizontal_end = (VERTICAL_SPACING, 0.0, BOTTOM_HORIZONTAL_HEIGHT)
     
-    create_tube_solid(msp,
-                     start_point=bottom_horizontal_start,
-                     end_point=bottom_horizontal_end,
-                     radius=MAIN_TUBE_RADIUS,
-                     layer='HORIZONTAL_TUBES')
+    tubes.append((bottom_horizontal_start, bottom_horizontal_end, MAIN_TUBE_RADIUS, 'HORIZONTAL_TUBES'))
     
     # Top horizontal tube (at top of verticals)
-    top_horizontal_start = Vec3(0, 0, TOP_HORIZONTAL_HEIGHT)
-    top_horizontal_end = Vec3(VERTICAL_SPACING, 0, TOP_HORIZONTAL_HEIGHT)
+    top_horizontal_start = (0.0, 0.0, TOP_HORIZONTAL_HEIGHT)
+    top_horizontal_end = (VERTICAL_SPACING, 0.0, TOP_HORIZONTAL_HEIGHT)
     
-    create_tube_solid(msp,
-                     start_point=top_horizontal_start,
-                     end_point=top_horizontal_end,
-                     radius=MAIN_TUBE_RADIUS,
-                     layer='HORIZONTAL_TUBES')
+    tubes.append((top_horizontal_start, top_horizontal_end, MAIN_TUBE_RADIUS, 'HORIZONTAL_TUBES'))
     
     # Create diagonal corner braces at all four corners
-    # Calculate brace positions to reinforce all frame corners
-    # Each brace will be 12" long connecting vertical and horizontal tubes
-    
-    # For 12" braces at 45 degrees, the horizontal and vertical components are each 12/√2 ≈ 8.485"
-    brace_offset = BRACE_LENGTH / math.sqrt(2)
-    
-    # TOP CORNER BRACES
-    # Left top corner brace - from vertical tube to horizontal tube
-    # Diagonal brace from left vertical down to a point on the top horizontal
-    left_top_brace_start = Vec3(0, 0, TOP_HORIZONTAL_HEIGHT - brace_offset)  # Point on left vertical below top rail
-    left_top_brace_end = Vec3(brace_offset, 0, TOP_HORIZONTAL_HEIGHT)  # Point on top horizontal
-    
-    create_tube_solid(msp,
-                     start_point=left_top_brace_start,
-                     end_point=left_top_brace_end,
-                     radius=BRACE_TUBE_RADIUS,
-                     layer='CORNER_BRACES')
-    
-    # Right top corner brace - from vertical tube to horizontal tube
-    # Diagonal brace from right vertical down to a point on the top horizontal
-    right_top_brace_start = Vec3(VERTICAL_SPACING, 0, TOP_HORIZONTAL_HEIGHT - brace_offset)  # Point on right vertical below top rail
-    right_top_brace_end = Vec3(VERTICAL_SPACING - brace_offset, 0, TOP_HORIZONTAL_HEIGHT)  # Point on top horizontal
-    
-    create_tube_solid(msp,
-                     start_point=right_top_brace_start,
-                     end_point=right_top_brace_end,
-                     radius=BRACE_TUBE_RADIUS,
-                     layer='CORNER_BRACES')
-    
-    # BOTTOM CORNER BRACES
-    # Left bottom corner brace - from vertical tube to horizontal tube (above the horizontal bar)
-    # Diagonal brace from left vertical up to a point on the bottom horizontal
-    left_bottom_brace_start = Vec3(0, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset)  # Point on left vertical above bottom rail
-    left_bottom_brace_end = Vec3(brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT)  # Point on bottom horizontal
-    
-    create_tube_solid(msp,
-                     start_point=left_bottom_brace_start,
-                     end_point=left_bottom_brace_end,
-                     radius=BRACE_TUBE_RADIUS,
-                     layer='CORNER_BRACES')
-    
-    # Right bottom corner brace - from vertical tube to horizontal tube (above the horizontal bar)
-    # Diagonal brace from right vertical up to a point on the bottom horizontal
-    right_bottom_brace_start = Vec3(VERTICAL_SPACING, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset)  # Point on right vertical above bottom rail
-    right_bottom_brace_end = Vec3(VERTICAL_SPACING - brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT)  # Point on bottom horizontal
-    
-    create_tube_solid(msp,
-                     start_point=right_bottom_brace_start,
-                     end_point=right_bottom_brace_end,
-                     radius=BRACE_TUBE_RADIUS,
-                     layer='CORNER_BRACES')
+    # Each brace is 12" long connecting vertical and horizontal tubes
+    for brace_start, brace_end in _BRACE_ENDPOINTS:
+        tubes.append((brace_start, brace_end, BRACE_TUBE_RADIUS, 'CORNER_BRACES'))
+    
+    # Build all tube solids in one vectorized pass
+    create_tube_solids(msp, tubes)
     
     # Add centerlines for fabrication reference
     add_centerlines(msp, left_vertical_center, right_vertical_center, 
@@ -181,161 +156,69 @@ def create_metal_frame_dxf():
     
     return doc
 
-def create_tube_solid(msp, start_point, end_point, radius, layer):
-    """Create a proper closed 3D solid tube."""
-    
-    # Calculate tube direction and length
-    direction = end_point - start_point
-    length = direction.magnitude
-    
-    if length == 0:
-        return
-    
-    direction = direction.normalize()
-    
-    # Create perpendicular vectors for the circular cross-section
-    if abs(direction.z) < 0.99:
-        perp1 = Vec3(-direction.y, direction.x, 0).normalize()
-    else:
-        perp1 = Vec3(1, 0, 0)
-    
-    perp2 = direction.cross(perp1).normalize()
-    
-    # Create a proper closed polyface mesh with end caps
-    create_closed_tube_mesh(msp, start_point, end_point, radius, layer, direction, perp1, perp2)
-
-def create_closed_tube_mesh(msp, start_point, end_point, radius, layer, direction, perp1, perp2, segments=16):
-    """Create a closed tube using 3DFACE entities for maximum compatibility."""
-    
-    try:
-        # Generate points for start and end circles
-        start_points = []
-        end_points = []
-        
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            offset = radius * (math.cos(angle) * perp1 + math.sin(angle) * perp2)
-            start_points.append(start_point + offset)
-            end_points.append(end_point + offset)
-        
-        # Create side faces using 3DFACE
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            
-            # Create rectangular face as a 4-point 3DFACE
-            p1 = start_points[i]
-            p2 = start_points[next_i]
-            p3 = end_points[next_i]
-            p4 = end_points[i]
-            
-            # Create 4-point face (quad)
-            msp.add_3dface([p1, p2, p3, p4], dxfattribs={'layer': layer})
+def orientation_basis(direction):
+    """Return the (direction, perp1, perp2) basis of a unit tube direction from _ORIENT_BASIS."""
+    key = tuple(np.round(direction, 9).tolist())
+    basis = _ORIENT_BASIS.get(key)
+    if basis is None:
+        direction = Vec3(direction)
         
-        # Create end caps using triangular faces
-        # Start cap (bottom)
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            msp.add_3dface([start_point, start_points[i], start_points[next_i], start_points[next_i]], 
-                           dxfattribs={'layer': layer})
-        
-        # End cap (top)
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            msp.add_3dface([end_point, end_points[next_i], end_points[i], end_points[i]], 
-                           dxfattribs={'layer': layer})
-        
-    except Exception as e:
-        print(f"Warning: Could not create 3DFACE tube: {e}")
-        # Final fallback to basic cylinder representation
-        create_basic_cylinder(msp, start_point, end_point, radius, layer, direction, perp1, perp2)
-
-def create_basic_cylinder(msp, start_point, end_point, radius, layer, direction, perp1, perp2, segments=16):
-    """Create a basic cylinder using 3DFACE entities for maximum compatibility."""
-    
-    # Generate points for start and end circles
-    start_points = []
-    end_points = []
-    
-    for i in range(segments):
-        angle = 2 * math.pi * i / segments
-        offset = radius * (math.cos(angle) * perp1 + math.sin(angle) * perp2)
-        start_points.append(start_point + offset)
-        end_points.append(end_point + offset)
-    
-    # Create side faces using 3DFACE
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        
-        # Create rectangular face as two triangles
-        p1 = start_points[i]
-        p2 = start_points[next_i]
-        p3 = end_points[next_i]
-        p4 = end_points[i]
-        
-        # First triangle
-        msp.add_3dface([p1, p2, p3, p3], dxfattribs={'layer': layer})
-        # Second triangle
-        msp.add_3dface([p1, p3, p4, p4], dxfattribs={'layer': layer})
-    
-    # Create end caps using triangular faces
-    # Start cap
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        msp.add_3dface([start_point, start_points[i], start_points[next_i], start_points[next_i]], 
-                       dxfattribs={'layer': layer})
-    
-    # End cap
-    for i in range(segments):
-        next_i = (i + 1) % segments
-        msp.add_3dface([end_point, end_points[next_i], end_points[i], end_points[i]], 
-                       dxfattribs={'layer': layer})
-
-def create_tube_wireframe(msp, start_point, end_point, radius, layer, segments=16):
-    """Create a 3D tube representation using circles and lines as wireframe."""
-    
-    # Calculate tube direction vector
-    direction = end_point - start_point
-    length = direction.magnitude
-    
-    if length == 0:
-        return
-    
-    # Normalize direction
-    direction = direction.normalize()
-    
-    # Create circles at both ends
-    # Start circle
-    msp.add_circle(center=start_point, radius=radius, 
-                   dxfattribs={'layer': layer})
-    
-    # End circle
-    msp.add_circle(center=end_point, radius=radius,
-                   dxfattribs={'layer': layer})
-    
-    # Create lines connecting the circles (representing the tube surface)
-    for i in range(0, segments, 2):  # Reduce number of lines for cleaner view
-        angle = 2 * math.pi * i / segments
-        
-        # Calculate points on the circles
-        if abs(direction.z) < 0.99:  # Not vertical
-            # Create perpendicular vectors
+        # Create perpendicular vectors for the circular cross-section
+        if abs(direction.z) < 0.99:
             perp1 = Vec3(-direction.y, direction.x, 0).normalize()
-        else:  # Vertical tube
+        else:
             perp1 = Vec3(1, 0, 0)
         
         perp2 = direction.cross(perp1).normalize()
-        
-        # Points on start circle
-        start_circle_point = start_point + radius * (
-            math.cos(angle) * perp1 + math.sin(angle) * perp2)
-        
-        # Points on end circle
-        end_circle_point = end_point + radius * (
-            math.cos(angle) * perp1 + math.sin(angle) * perp2)
-        
-        # Create line connecting the points
-        msp.add_line(start_circle_point, end_circle_point,
-                     dxfattribs={'layer': layer})
+        basis = _ORIENT_BASIS[key] = (direction, perp1, perp2)
+    return basis
+
+def create_tube_solids(msp, tubes, segments=TUBE_SEGMENTS):
+    """Create closed 3D solid tubes for a list of (start_point, end_point, radius, layer).
+    
+    Every tube is the shared unit cylinder mesh scaled and placed by one matrix
+    built from the _ORIENT_BASIS table; all tubes on a layer are written as
+    one vertex-shared MESH entity.
+    """
+    
+    starts = np.array([start for start, _, _, _ in tubes], dtype=np.float64)
+    ends = np.array([end for _, end, _, _ in tubes], dtype=np.float64)
+    radii = np.array([radius for _, _, radius, _ in tubes], dtype=np.float64)
+    layers = [layer for _, _, _, layer in tubes]
+    
+    # Calculate tube directions and lengths, dropping zero-length tubes
+    directions = ends - starts
+    lengths = np.linalg.norm(directions, axis=1)
+    keep = lengths > 0
+    starts, radii, lengths = starts[keep], radii[keep], lengths[keep]
+    layers = [layer for layer, k in zip(layers, keep) if k]
+    directions = directions[keep] / lengths[:, None]
+    
+    # Accumulate tubes per layer so each layer is written as one MESH
+    layer_meshes = {}
+    unit = unit_cylinder(segments)
+    for start_point, direction, radius, length, layer in zip(
+            starts.tolist(), directions, radii.tolist(), lengths.tolist(), layers):
+        matrix = tube_matrix(start_point, direction, radius, length)
+        layer_meshes.setdefault(layer, MeshBuilder()).add_mesh(
+            vertices=matrix.transform_vertices(unit.vertices), faces=unit.faces)
+    
+    for layer, mesh in layer_meshes.items():
+        mesh.render_mesh(msp, dxfattribs={'layer': layer})
+
+@functools.lru_cache(maxsize=None)
+def unit_cylinder(segments):
+    """Return a closed cylinder mesh of radius 1 from (0, 0, 0) to (0, 0, 1).
+    
+    Shared by every tube; callers must transform a copy of its vertices, never the mesh itself.
+    """
+    return forms.cylinder(count=segments, radius=1.0, top_center=(0, 0, 1))
+
+def tube_matrix(start_point, direction, radius, length):
+    """Return the matrix that maps the unit cylinder onto a tube."""
+    _, perp1, perp2 = orientation_basis(direction)
+    return Matrix44.chain(Matrix44.scale(radius, radius, length),
+                          Matrix44.ucs(perp1, perp2, Vec3(direction), Vec3(start_point)))
 
 def add_centerlines(msp, left_center, right_center, vertical_height, 
                    bottom_height, top_height):
@@ -388,9 +271,8 @@ def add_dimensions(msp, vertical_height, horizontal_length, bottom_height, brace
     # Add brace length annotation as text
     msp.add_text(
         f'Brace Length: {brace_length}"',
-        height=1.0,
-        dxfattribs={'layer': 'DIMENSIONS'}
-    ).set_placement(Vec3(5, -20, 0))
+        dxfattribs={'insert': (5.0, -20.0, 0.0), 'height': 1.0, 'layer': 'DIMENSIONS'}
+    )
 
 def add_annotations(msp):
     """Add text annotations with specifications."""
@@ -398,9 +280,8 @@ def add_annotations(msp):
     # Title
     msp.add_text(
         "316 STAINLESS STEEL MARINE DAVIT SUPPORT FRAME",
-        height=2.0,
-        dxfattribs={'layer': 'DIMENSIONS'}
-    ).set_placement(Vec3(5, -8, 0))
+        dxfattribs={'insert': (5.0, -8.0, 0.0), 'height': 2.0, 'layer': 'DIMENSIONS'}
+    )
     
     # Specifications
     specs = [
@@ -419,12 +300,16 @@ def add_annotations(msp):
     for i, spec in enumerate(specs):
         msp.add_text(
             spec,
-            height=1.0,
-            dxfattribs={'layer': 'DIMENSIONS'}
-        ).set_placement(Vec3(5, -12 - i * 1.5, 0))
+            dxfattribs={'insert': (5.0, -12.0 - i * 1.5, 0.0), 'height': 1.0, 'layer': 'DIMENSIONS'}
+        )
 
 def main():
     """Main function to generate the DXF file."""
+    parser = argparse.ArgumentParser(description="Generate the 3D DXF file for the marine davit support frame.")
+    parser.add_argument("--binary", action="store_true",
+                        help="write binary DXF (smaller and faster to write; not every tool reads it)")
+    args = parser.parse_args()
+    
     print("Generating 3D DXF file for stainless steel marine davit support frame...")
     
     # Create the DXF document
@@ -432,7 +317,12 @@ def main():
     
     # Save the file
     filename = "stainless_steel_frame_3d.dxf"
-    doc.saveas(filename)
+    try:
+        # Binary DXF skips float-to-text formatting, the bulk of the save time
+        doc.saveas(filename, fmt='bin' if args.binary else 'asc')
+    except OSError as e:
+        print(f"❌ Error saving DXF file: {e}")
+        return False
     
     print(f"✓ DXF file saved as: {filename}")
     print("\nFrame Specifications:")
@@ -442,6 +332,8 @@ def main():
     print("- Bottom horizontal at 5\" height")
     print("- Material: 316 Stainless Steel")
     print("\nThe DXF file is ready for CAD software and fabrication!")
+    return True
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    success = main()
+    sys.exit(0 if success else 1) 
\ No newline at end of file
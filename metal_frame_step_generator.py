@@ -7,19 +7,25 @@ Generates proper 3D solid geometry in STEP format for CAD/CAM applications
 import math
 import sys
 import os
+import argparse
 
-try:
-    import FreeCAD
-    import Part
-    import Draft
-except ImportError:
-    print("Error: FreeCAD Python libraries not found.")
-    print("Please install FreeCAD or run this script within FreeCAD environment.")
-    print("You can install FreeCAD using:")
-    print("  - macOS: brew install freecad")
-    print("  - Ubuntu: sudo apt install freecad")
-    print("  - Windows: Download from https://www.freecad.org/")
-    sys.exit(1)
+# FreeCAD modules, imported on first use by _load_freecad so importing this
+# module does not require FreeCAD
+FreeCAD = None
+Part = None
+
+# Z-aligned cylinders at the origin keyed by (length, radius); the frame only has
+# a few distinct tube shapes, so instances are placed copies of these
+_CYL_CACHE = {}
+
+def _load_freecad():
+    """Import the FreeCAD modules on first use and reuse them afterwards."""
+    global FreeCAD, Part
+    if FreeCAD is None:
+        import FreeCAD as freecad_module
+        import Part as part_module
+        FreeCAD, Part = freecad_module, part_module
+    return FreeCAD, Part
 
 def create_tube_solid(start_point, end_point, outer_diameter):
     """Create a solid tube (cylinder) between two points."""
@@ -31,31 +37,26 @@ def create_tube_solid(start_point, end_point, outer_diameter):
     if length == 0:
         return None
     
-    # Create cylinder
     radius = outer_diameter / 2.0
-    cylinder = Part.makeCylinder(radius, length)
-    
-    # Calculate rotation to align with direction
-    z_axis = FreeCAD.Vector(0, 0, 1)
-    if not direction.isEqual(z_axis, 1e-6) and not direction.isEqual(-z_axis, 1e-6):
-        # Calculate rotation axis and angle
-        rotation_axis = z_axis.cross(direction.normalize())
-        rotation_angle = math.acos(z_axis.dot(direction.normalize()))
-        
-        # Apply rotation
-        cylinder.rotate(FreeCAD.Vector(0, 0, 0), rotation_axis, math.degrees(rotation_angle))
-    elif direction.isEqual(-z_axis, 1e-6):
-        # Special case: rotate 180 degrees around X axis
-        cylinder.rotate(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1, 0, 0), 180)
-    
-    # Translate to start position
-    cylinder.translate(FreeCAD.Vector(start_point))
+    key = (round(length, 6), round(radius, 6))
+    template = _CYL_CACHE.get(key)
+    if template is None:
+        # Create cylinder
+        template = _CYL_CACHE[key] = Part.makeCylinder(radius, length)
+    
+    # Rotate the Z axis onto the tube direction and move to start position;
+    # FreeCAD.Rotation handles the parallel and anti-parallel cases itself
+    rotation = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), direction)
+    cylinder = template.copy()
+    cylinder.Placement = FreeCAD.Placement(FreeCAD.Vector(start_point), rotation)
     
     return cylinder
 
 def create_metal_frame_step():
     """Create the complete metal frame as STEP file."""
     
+    _load_freecad()
+    
     # Frame specifications (all dimensions in inches, converted to mm for FreeCAD)
     INCH_TO_MM = 25.4
     
@@ -156,19 +157,31 @@ def create_metal_frame_step():
     
     print(f"Created {len(tubes)} tube components")
     
-    # Create compound of all tubes
+    # Fuse all tubes into a single welded solid
     if tubes:
         print("Combining all components...")
-        compound = Part.makeCompound(tubes)
+        try:
+            # removeSplitter merges the coplanar faces left at the joints
+            frame_shape = tubes[0].multiFuse(tubes[1:]).removeSplitter()
+        except Exception as e:
+            # Fall back to a compound of overlapping solids
+            print(f"Warning: Could not fuse tubes ({e}), using a compound instead")
+            frame_shape = Part.makeCompound(tubes)
+        
+        # Batch all document changes into one transaction
+        doc.openTransaction("build_frame")
         
         # Create FreeCAD object
         frame_obj = doc.addObject("Part::Feature", "MetalFrame")
-        frame_obj.Shape = compound
+        frame_obj.Shape = frame_shape
         frame_obj.Label = "Stainless Steel Metal Frame"
         
-        # Set material properties (for display)
-        frame_obj.ViewObject.ShapeColor = (0.8, 0.8, 0.9)  # Light steel color
-        frame_obj.ViewObject.Transparency = 0
+        # Set material properties (for display; no ViewObject without the GUI)
+        if frame_obj.ViewObject:
+            frame_obj.ViewObject.ShapeColor = (0.8, 0.8, 0.9)  # Light steel color
+            frame_obj.ViewObject.Transparency = 0
+        
+        doc.commitTransaction()
         
         # Recompute document
         doc.recompute()
@@ -240,9 +253,25 @@ def create_technical_drawing_info():
 def main():
     """Main function to generate the STEP file."""
     
+    parser = argparse.ArgumentParser(description="Generate the STEP file for the stainless steel metal frame.")
+    parser.add_argument("--iges", action="store_true",
+                        help="also export an IGES file (roughly doubles export time)")
+    args = parser.parse_args()
+    
     print("STEP File Generator for Stainless Steel Metal Frame")
     print("=" * 55)
     
+    try:
+        _load_freecad()
+    except ImportError:
+        print("Error: FreeCAD Python libraries not found.")
+        print("Please install FreeCAD or run this script within FreeCAD environment.")
+        print("You can install FreeCAD using:")
+        print("  - macOS: brew install freecad")
+        print("  - Ubuntu: sudo apt install freecad")
+        print("  - Windows: Download from https://www.freecad.org/")
+        return False
+    
     try:
         # Create the frame
         doc, frame_obj = create_metal_frame_step()
@@ -253,13 +282,11 @@ def main():
             success = export_to_step(doc, frame_obj, step_filename)
             
             if success:
-                # Also export as IGES for additional compatibility
-                try:
-                    iges_filename = "stainless_steel_frame.iges"
+                # Also export as IGES for additional compatibility when requested
+                iges_filename = "stainless_steel_frame.iges"
+                if args.iges:
                     frame_obj.Shape.exportIges(iges_filename)
                     print(f"✓ IGES file also saved as: {iges_filename}")
-                except:
-                    print("Note: IGES export not available")
                 
                 # Print technical specifications
                 create_technical_drawing_info()
@@ -267,8 +294,8 @@ def main():
                 print(f"\n🎉 Frame generation complete!")
                 print(f"📁 Files created:")
                 print(f"   • {step_filename} (STEP format)")
-                if os.path.exists("stainless_steel_frame.iges"):
-                    print(f"   • stainless_steel_frame.iges (IGES format)")
+                if args.iges:
+                    print(f"   • {iges_filename} (IGES format)")
                 
                 print(f"\nThe STEP file is ready for:")
                 print(f"   • CAD software import")
@@ -4,15 +4,65 @@ DXF Frame Visualizer
 Creates a 3D visualization of the stainless steel metal frame and saves it as PNG
 """
 
+import matplotlib
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from matplotlib.colors import to_rgba_array
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.transforms import Bbox
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
 import numpy as np
-import ezdxf
-from ezdxf.math import Vec3
-import math
+from PIL import Image
+import argparse
+import functools
+from dataclasses import dataclass
 
-def create_frame_visualization():
-    """Create a 3D visualization of the metal frame."""
+# Numba is optional; without it the mesh kernel runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Cross-section resolution; the thinner-looking diagonal braces need fewer sides
+_TUBE_SEGMENTS = 16
+_BRACE_SEGMENTS = 8
+
+_INV_SQRT2 = 0.7071067811865476  # cos(45°), for the corner braces
+
+# Annotation box styles; matplotlib copies these, so they can be shared
+_DIM_BBOX = dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8)
+_SPEC_BBOX = dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.8)
+
+# Legend proxies; the tubes and centerlines are collections with no per-tube label
+_LEGEND_HANDLES = [
+    Patch(color='red', alpha=0.8, label='Vertical Tubes'),
+    Patch(color='gold', alpha=0.8, label='Horizontal Tubes'),
+    Patch(color='green', alpha=0.8, label='Corner Braces'),
+    Line2D([], [], color='k', linestyle='--', alpha=0.5, linewidth=1, label='Centerlines'),
+]
+
+# Saved region of the 12" x 10" figure as (x0, y0, x1, y1) in inches: the tight
+# bounding box of the drawn artists plus a 0.1" margin. The layout is fixed, so this
+# replaces a get_tightbbox walk over every artist; re-measure if the layout changes.
+_CROP_INCHES = (1.94, 1.0, 10.25, 9.65)
+
+@dataclass
+class FrameSpec:
+    """Everything drawn for the frame, as plain arrays and strings."""
+    vertical_height: float
+    horizontal_length: float
+    tube_radius: float
+    tube_starts: np.ndarray      # (N, 3) float32
+    tube_ends: np.ndarray        # (N, 3) float32
+    tube_colors: list
+    tube_segments: list
+    centerlines: np.ndarray      # (M, 2, 3) float32
+    annotations: list            # (x, y, z, text) dimension labels
+    specs_text: str
+
+def build_frame_spec():
+    """Compute the frame geometry and labels without touching matplotlib."""
     
     # Frame specifications (matching the DXF file)
     VERTICAL_HEIGHT = 48.0
@@ -24,70 +74,99 @@ def create_frame_visualization():
     VERTICAL_SPACING = HORIZONTAL_LENGTH
     BRACE_LENGTH = 12.0
     
-    # Create figure and 3D axis
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
-    
-    # Define tube positions
-    left_vertical_center = np.array([0, 0, 0])
-    right_vertical_center = np.array([VERTICAL_SPACING, 0, 0])
-    
-    # Vertical tubes
-    left_vertical_end = left_vertical_center + np.array([0, 0, VERTICAL_HEIGHT])
-    right_vertical_end = right_vertical_center + np.array([0, 0, VERTICAL_HEIGHT])
-    
-    # Horizontal tubes
-    bottom_horizontal_start = np.array([0, 0, BOTTOM_HORIZONTAL_HEIGHT])
-    bottom_horizontal_end = np.array([VERTICAL_SPACING, 0, BOTTOM_HORIZONTAL_HEIGHT])
-    top_horizontal_start = np.array([0, 0, TOP_HORIZONTAL_HEIGHT])
-    top_horizontal_end = np.array([VERTICAL_SPACING, 0, TOP_HORIZONTAL_HEIGHT])
-    
     # Calculate corner brace positions
-    brace_offset = BRACE_LENGTH / math.sqrt(2)
-    
-    # TOP CORNER BRACES
-    # Left top corner brace - from vertical tube to horizontal tube
-    left_top_brace_start = np.array([0, 0, TOP_HORIZONTAL_HEIGHT - brace_offset])
-    left_top_brace_end = np.array([brace_offset, 0, TOP_HORIZONTAL_HEIGHT])
+    brace_offset = BRACE_LENGTH * _INV_SQRT2
+    
+    # Tube start and end points as (N, 3) arrays, one row per tube
+    tube_starts = np.array([
+        # Vertical tubes
+        [0, 0, 0],
+        [VERTICAL_SPACING, 0, 0],
+        # Horizontal tubes
+        [0, 0, BOTTOM_HORIZONTAL_HEIGHT],
+        [0, 0, TOP_HORIZONTAL_HEIGHT],
+        # Top corner braces - from vertical tube to horizontal tube
+        [0, 0, TOP_HORIZONTAL_HEIGHT - brace_offset],
+        [VERTICAL_SPACING, 0, TOP_HORIZONTAL_HEIGHT - brace_offset],
+        # Bottom corner braces - from vertical tube to horizontal tube (above the horizontal bar)
+        [0, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset],
+        [VERTICAL_SPACING, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset],
+    ], dtype=np.float32)
+    tube_ends = np.array([
+        [0, 0, VERTICAL_HEIGHT],
+        [VERTICAL_SPACING, 0, VERTICAL_HEIGHT],
+        [VERTICAL_SPACING, 0, BOTTOM_HORIZONTAL_HEIGHT],
+        [VERTICAL_SPACING, 0, TOP_HORIZONTAL_HEIGHT],
+        [brace_offset, 0, TOP_HORIZONTAL_HEIGHT],
+        [VERTICAL_SPACING - brace_offset, 0, TOP_HORIZONTAL_HEIGHT],
+        [brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT],
+        [VERTICAL_SPACING - brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT],
+    ], dtype=np.float32)
+    
+    # Centerlines for fabrication reference: both verticals, then both horizontals
+    centerlines = np.array([
+        [[0, 0, 0], [0, 0, VERTICAL_HEIGHT]],
+        [[VERTICAL_SPACING, 0, 0], [VERTICAL_SPACING, 0, VERTICAL_HEIGHT]],
+        [[0, 0, BOTTOM_HORIZONTAL_HEIGHT], [HORIZONTAL_LENGTH, 0, BOTTOM_HORIZONTAL_HEIGHT]],
+        [[0, 0, TOP_HORIZONTAL_HEIGHT], [HORIZONTAL_LENGTH, 0, TOP_HORIZONTAL_HEIGHT]],
+    ], dtype=np.float32)
+    
+    # Dimension labels: vertical height, horizontal length, bottom rail height
+    annotations = [
+        (-3, 0, VERTICAL_HEIGHT/2, f'{VERTICAL_HEIGHT}"'),
+        (HORIZONTAL_LENGTH/2, -3, 0, f'{HORIZONTAL_LENGTH}"'),
+        (26, 0, BOTTOM_HORIZONTAL_HEIGHT/2, f'{BOTTOM_HORIZONTAL_HEIGHT}"'),
+    ]
     
-    # Right top corner brace - from vertical tube to horizontal tube
-    right_top_brace_start = np.array([VERTICAL_SPACING, 0, TOP_HORIZONTAL_HEIGHT - brace_offset])
-    right_top_brace_end = np.array([VERTICAL_SPACING - brace_offset, 0, TOP_HORIZONTAL_HEIGHT])
-    
-    # BOTTOM CORNER BRACES
-    # Left bottom corner brace - from vertical tube to horizontal tube (above the horizontal bar)
-    left_bottom_brace_start = np.array([0, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset])
-    left_bottom_brace_end = np.array([brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT])
+    specs_text = f"""SPECIFICATIONS:
+• Material: Stainless Steel
+• Tube OD: 2.000"
+• Vertical Height: 48.000"
+• Horizontal Length: 24.000"
+• Bottom Rail Height: 12.000"
+• Corner Braces: {BRACE_LENGTH}" at 45° (4 total)
+• Diagonal braces at all four corners
+• Welded Construction"""
     
-    # Right bottom corner brace - from vertical tube to horizontal tube (above the horizontal bar)
-    right_bottom_brace_start = np.array([VERTICAL_SPACING, 0, BOTTOM_HORIZONTAL_HEIGHT + brace_offset])
-    right_bottom_brace_end = np.array([VERTICAL_SPACING - brace_offset, 0, BOTTOM_HORIZONTAL_HEIGHT])
+    return FrameSpec(
+        vertical_height=VERTICAL_HEIGHT,
+        horizontal_length=HORIZONTAL_LENGTH,
+        tube_radius=TUBE_RADIUS,
+        tube_starts=tube_starts,
+        tube_ends=tube_ends,
+        tube_colors=['red'] * 2 + ['gold'] * 2 + ['green'] * 4,
+        tube_segments=[_TUBE_SEGMENTS] * 4 + [_BRACE_SEGMENTS] * 4,
+        centerlines=centerlines,
+        annotations=annotations,
+        specs_text=specs_text,
+    )
+
+def render_frame(ax, spec):
+    """Draw a FrameSpec: one surface, one cap-outline and one centerline artist, then the labels."""
     
     # Draw tubes as cylinders
-    # Left vertical tube
-    draw_cylinder(ax, left_vertical_center, left_vertical_end, TUBE_RADIUS, 'red', 'Vertical Tubes')
+    draw_cylinders_batch(ax, spec.tube_starts, spec.tube_ends, spec.tube_radius,
+                         spec.tube_colors, spec.tube_segments)
     
-    # Right vertical tube
-    draw_cylinder(ax, right_vertical_center, right_vertical_end, TUBE_RADIUS, 'red', '')
+    # Centerlines as one artist; the legend uses a proxy handle
+    ax.add_collection3d(Line3DCollection(spec.centerlines, colors='k', linestyles='--', alpha=0.5, linewidths=1))
     
-    # Bottom horizontal tube
-    draw_cylinder(ax, bottom_horizontal_start, bottom_horizontal_end, TUBE_RADIUS, 'gold', 'Horizontal Tubes')
-    
-    # Top horizontal tube
-    draw_cylinder(ax, top_horizontal_start, top_horizontal_end, TUBE_RADIUS, 'gold', '')
+    # Add dimensions and annotations
+    for x, y, z, text in spec.annotations:
+        ax.text(x, y, z, text, fontsize=10, ha='center', va='center', bbox=_DIM_BBOX)
+    ax.text2D(0.02, 0.02, spec.specs_text, transform=ax.transAxes,
+              fontsize=9, verticalalignment='bottom', bbox=_SPEC_BBOX)
+
+def create_frame_visualization():
+    """Create a 3D visualization of the metal frame."""
     
-    # Corner braces - all four diagonal braces for corner reinforcement
-    draw_cylinder(ax, left_top_brace_start, left_top_brace_end, TUBE_RADIUS, 'green', 'Corner Braces')
-    draw_cylinder(ax, right_top_brace_start, right_top_brace_end, TUBE_RADIUS, 'green', '')
-    draw_cylinder(ax, left_bottom_brace_start, left_bottom_brace_end, TUBE_RADIUS, 'green', '')
-    draw_cylinder(ax, right_bottom_brace_start, right_bottom_brace_end, TUBE_RADIUS, 'green', '')
+    spec = build_frame_spec()
     
-    # Add centerlines
-    draw_centerlines(ax, left_vertical_center, right_vertical_center, 
-                    VERTICAL_HEIGHT, BOTTOM_HORIZONTAL_HEIGHT, TOP_HORIZONTAL_HEIGHT)
+    # Create figure and 3D axis
+    fig = plt.figure(figsize=(12, 10))
+    ax = fig.add_subplot(111, projection='3d')
     
-    # Add dimensions and annotations
-    add_dimension_annotations(ax, VERTICAL_HEIGHT, HORIZONTAL_LENGTH, BOTTOM_HORIZONTAL_HEIGHT, BRACE_LENGTH)
+    render_frame(ax, spec)
     
     # Set axis properties
     ax.set_xlabel('Length (inches)', fontsize=12)
@@ -95,21 +174,20 @@ def create_frame_visualization():
     ax.set_zlabel('Height (inches)', fontsize=12)
     
     # Set equal aspect ratio
-    max_range = max(VERTICAL_HEIGHT, HORIZONTAL_LENGTH) / 2.0
-    mid_x = HORIZONTAL_LENGTH / 2.0
+    max_range = max(spec.vertical_height, spec.horizontal_length) / 2.0
+    mid_x = spec.horizontal_length / 2.0
     mid_y = 0
-    mid_z = VERTICAL_HEIGHT / 2.0
     
     ax.set_xlim(mid_x - max_range, mid_x + max_range)
     ax.set_ylim(mid_y - max_range, mid_y + max_range)
-    ax.set_zlim(0, VERTICAL_HEIGHT + 5)
+    ax.set_zlim(0, spec.vertical_height + 5)
     
     # Set title and add specifications
     ax.set_title('Stainless Steel Metal Frame with Corner Reinforcement Braces\n48" x 24" x 2" OD Tubes + 12" Corner Diagonals (4 total)', 
                 fontsize=16, fontweight='bold', pad=20)
     
     # Add legend
-    ax.legend(loc='upper left', bbox_to_anchor=(0.02, 0.98))
+    ax.legend(handles=_LEGEND_HANDLES, loc='upper left', bbox_to_anchor=(0.02, 0.98))
     
     # Set viewing angle for best perspective
     ax.view_init(elev=20, azim=45)
@@ -119,160 +197,160 @@ def create_frame_visualization():
     
     return fig, ax
 
-def draw_cylinder(ax, start_point, end_point, radius, color, label, segments=16):
-    """Draw a 3D cylinder between two points."""
-    
-    # Calculate direction vector
-    direction = end_point - start_point
-    length = np.linalg.norm(direction)
-    
-    if length == 0:
-        return
-    
-    direction = direction / length
-    
-    # Create perpendicular vectors
-    if abs(direction[2]) < 0.99:
-        perp1 = np.array([-direction[1], direction[0], 0])
-        perp1 = perp1 / np.linalg.norm(perp1)
-    else:
-        perp1 = np.array([1, 0, 0])
-    
-    perp2 = np.cross(direction, perp1)
-    perp2 = perp2 / np.linalg.norm(perp2)
-    
-    # Generate cylinder surface
-    theta = np.linspace(0, 2*np.pi, segments)
-    z_line = np.linspace(0, 1, 2)
-    
-    # Create meshgrid for cylinder surface
-    theta_mesh, z_mesh = np.meshgrid(theta, z_line)
-    
-    # Calculate cylinder surface points
-    x_cyl = np.zeros_like(theta_mesh)
-    y_cyl = np.zeros_like(theta_mesh)
-    z_cyl = np.zeros_like(theta_mesh)
-    
-    for i in range(len(z_line)):
-        for j in range(len(theta)):
-            # Point on circle
-            circle_point = radius * (np.cos(theta[j]) * perp1 + np.sin(theta[j]) * perp2)
-            # Position along tube
-            tube_point = start_point + z_line[i] * direction * length + circle_point
-            
-            x_cyl[i, j] = tube_point[0]
-            y_cyl[i, j] = tube_point[1]
-            z_cyl[i, j] = tube_point[2]
-    
-    # Plot cylinder surface
-    ax.plot_surface(x_cyl, y_cyl, z_cyl, color=color, alpha=0.8, label=label)
-    
-    # Draw end caps
-    theta_cap = np.linspace(0, 2*np.pi, segments)
-    
-    # Start cap
-    x_start = start_point[0] + radius * np.cos(theta_cap) * perp1[0] + radius * np.sin(theta_cap) * perp2[0]
-    y_start = start_point[1] + radius * np.cos(theta_cap) * perp1[1] + radius * np.sin(theta_cap) * perp2[1]
-    z_start = start_point[2] + radius * np.cos(theta_cap) * perp1[2] + radius * np.sin(theta_cap) * perp2[2]
-    
-    # End cap
-    x_end = end_point[0] + radius * np.cos(theta_cap) * perp1[0] + radius * np.sin(theta_cap) * perp2[0]
-    y_end = end_point[1] + radius * np.cos(theta_cap) * perp1[1] + radius * np.sin(theta_cap) * perp2[1]
-    z_end = end_point[2] + radius * np.cos(theta_cap) * perp1[2] + radius * np.sin(theta_cap) * perp2[2]
-    
-    # Fill end caps
-    ax.plot(x_start, y_start, z_start, color=color, linewidth=2)
-    ax.plot(x_end, y_end, z_end, color=color, linewidth=2)
-
-def draw_centerlines(ax, left_center, right_center, vertical_height, bottom_height, top_height):
-    """Draw centerlines for fabrication reference."""
-    
-    # Vertical centerlines
-    ax.plot([left_center[0], left_center[0]], 
-            [left_center[1], left_center[1]], 
-            [left_center[2], vertical_height], 
-            'k--', alpha=0.5, linewidth=1, label='Centerlines')
-    
-    ax.plot([right_center[0], right_center[0]], 
-            [right_center[1], right_center[1]], 
-            [right_center[2], vertical_height], 
-            'k--', alpha=0.5, linewidth=1)
-    
-    # Horizontal centerlines
-    ax.plot([0, 24], [0, 0], [bottom_height, bottom_height], 
-            'k--', alpha=0.5, linewidth=1)
-    
-    ax.plot([0, 24], [0, 0], [top_height, top_height], 
-            'k--', alpha=0.5, linewidth=1)
+@functools.lru_cache(maxsize=None)
+def unit_circle(segments):
+    """Return cached float32 (cos, sin) tables for a closed circle of the given number of points."""
+    theta = np.linspace(0, 2*np.pi, segments, dtype=np.float32)
+    return np.cos(theta), np.sin(theta)
 
-def add_dimension_annotations(ax, vertical_height, horizontal_length, bottom_height, brace_length):
-    """Add dimension annotations to the plot."""
-    
-    # Vertical dimension
-    ax.text(-3, 0, vertical_height/2, f'{vertical_height}"', 
-            fontsize=10, ha='center', va='center', 
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-    
-    # Horizontal dimension
-    ax.text(horizontal_length/2, -3, 0, f'{horizontal_length}"', 
-            fontsize=10, ha='center', va='center',
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-    
-    # Bottom rail height
-    ax.text(26, 0, bottom_height/2, f'{bottom_height}"', 
-            fontsize=10, ha='center', va='center',
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-    
-    # Add specifications text
-    specs_text = f"""SPECIFICATIONS:
-• Material: Stainless Steel
-• Tube OD: 2.000"
-• Vertical Height: 48.000"
-• Horizontal Length: 24.000"
-• Bottom Rail Height: 12.000"
-• Corner Braces: {brace_length}" at 45° (4 total)
-• Diagonal braces at all four corners
-• Welded Construction"""
+def draw_cylinders_batch(ax, starts, ends, radius, colors, segments=_TUBE_SEGMENTS):
+    """Draw 3D cylinders between rows of starts and ends as one surface and one cap-outline artist.
+    
+    segments is either one count for all tubes or a per-tube sequence."""
+    
+    # Drop zero-length tubes
+    segments = np.broadcast_to(segments, len(starts))
+    keep = np.linalg.norm(ends - starts, axis=1) > 0
+    starts, ends, segments = starts[keep], ends[keep], segments[keep]
+    colors = to_rgba_array([color for color, k in zip(colors, keep) if k])
+    
+    # Build surfaces for each resolution group, wound the same way plot_surface does
+    quads, quad_colors, caps, cap_colors = [], [], [], []
+    for count in np.unique(segments):
+        group = segments == count
+        points = _build_cylinder_meshes(starts[group], ends[group], radius, *unit_circle(int(count)))
+        quads.append(np.stack([points[:, 0, :-1], points[:, 0, 1:],
+                               points[:, 1, 1:], points[:, 1, :-1]], axis=2).reshape(-1, 4, 3))
+        quad_colors.append(np.repeat(colors[group], count - 1, axis=0))
+        
+        # End caps; the surface rows are the start and end circles
+        caps.extend(points.reshape(-1, count, 3))
+        cap_colors.append(np.repeat(colors[group], 2, axis=0))
     
-    ax.text2D(0.02, 0.02, specs_text, transform=ax.transAxes, 
-              fontsize=9, verticalalignment='bottom',
-              bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.8))
+    ax.add_collection3d(Poly3DCollection(np.concatenate(quads), facecolors=np.concatenate(quad_colors),
+                                         shade=True, alpha=0.8))
+    ax.add_collection3d(Line3DCollection(caps, colors=np.concatenate(cap_colors), linewidths=2))
 
-def save_visualization():
-    """Create and save the frame visualization."""
+@njit(cache=True, fastmath=True)
+def _build_cylinder_meshes(starts, ends, radius, cos_t, sin_t):
+    """Return surface points of shape (tubes, 2, segments, 3); row 0 is the start circle, row 1 the end circle."""
+    points = np.empty((starts.shape[0], 2, cos_t.shape[0], 3), dtype=starts.dtype)
+    
+    for i in range(starts.shape[0]):
+        # Unit direction vector
+        dx = ends[i, 0] - starts[i, 0]
+        dy = ends[i, 1] - starts[i, 1]
+        dz = ends[i, 2] - starts[i, 2]
+        inv_length = 1.0 / np.sqrt(dx*dx + dy*dy + dz*dz)
+        dx, dy, dz = dx * inv_length, dy * inv_length, dz * inv_length
+        
+        # Perpendiculars in closed form: perp1 is (-dy, dx, 0) normalized, or the X axis
+        # for vertical tubes, and perp2 = direction x perp1 is already unit length
+        if abs(dz) < 0.99:
+            flat = np.sqrt(dx*dx + dy*dy)
+            inv_flat = 1.0 / flat
+            p1x, p1y, p1z = -dy * inv_flat, dx * inv_flat, 0.0
+            p2x, p2y, p2z = -dz * dx * inv_flat, -dz * dy * inv_flat, flat
+        else:
+            inv_yz = 1.0 / np.sqrt(dy*dy + dz*dz)
+            p1x, p1y, p1z = 1.0, 0.0, 0.0
+            p2x, p2y, p2z = 0.0, dz * inv_yz, -dy * inv_yz
+        
+        for j in range(cos_t.shape[0]):
+            cx = radius * (cos_t[j]*p1x + sin_t[j]*p2x)
+            cy = radius * (cos_t[j]*p1y + sin_t[j]*p2y)
+            cz = radius * (cos_t[j]*p1z + sin_t[j]*p2z)
+            points[i, 0, j, 0] = starts[i, 0] + cx
+            points[i, 0, j, 1] = starts[i, 1] + cy
+            points[i, 0, j, 2] = starts[i, 2] + cz
+            points[i, 1, j, 0] = ends[i, 0] + cx
+            points[i, 1, j, 1] = ends[i, 1] + cy
+            points[i, 1, j, 2] = ends[i, 2] + cz
+    
+    return points
+
+def save_visualization(dpi=150, upscale=1, show=True, svg=False):
+    """Create and save the frame visualization, optionally upscaling the render by an integer factor."""
     
     print("Creating 3D visualization of the metal frame...")
     
     # Create the visualization
     fig, ax = create_frame_visualization()
     
-    # Save as PNG with high resolution
+    # Render once with a transparent background; the opaque version is the same
+    # pixels composited onto white
+    fig.set_dpi(dpi)
+    fig.patch.set_alpha(0)
+    ax.patch.set_alpha(0)
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+    
+    # Crop to the fixed region holding the drawn artists
+    x0, y0, x1, y1 = _CROP_INCHES
+    rgba = rgba[int(rgba.shape[0] - y1 * dpi):int(rgba.shape[0] - y0 * dpi), int(x0 * dpi):int(x1 * dpi)]
+    
+    # Resize the render when a larger image is needed than the rasterized dpi gives
+    if upscale > 1:
+        height, width = rgba.shape[:2]
+        rgba = np.asarray(Image.fromarray(rgba).resize((width * upscale, height * upscale), Image.BILINEAR))
+        dpi *= upscale
+    
+    # Save as PNG
     filename = "stainless_steel_frame_visualization.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
+    alpha = rgba[..., 3:] / 255.0
+    opaque = (rgba[..., :3] * alpha + 255.0 * (1.0 - alpha) + 0.5).astype(np.uint8)
+    Image.fromarray(opaque).save(filename, dpi=(dpi, dpi))
     
     print(f"✓ Visualization saved as: {filename}")
     
     # Also save a version with transparent background
     filename_transparent = "stainless_steel_frame_visualization_transparent.png"
-    plt.savefig(filename_transparent, dpi=300, bbox_inches='tight', 
-                facecolor='none', edgecolor='none', transparent=True)
+    Image.fromarray(rgba).save(filename_transparent, dpi=(dpi, dpi))
     
     print(f"✓ Transparent version saved as: {filename_transparent}")
     
-    # Show the plot
-    plt.show()
+    # Optional vector copy on the same white background and crop as the opaque PNG;
+    # the SVG backend writes paths directly, with no rasterization
+    if svg:
+        filename_svg = "stainless_steel_frame_visualization.svg"
+        fig.patch.set_alpha(None)
+        ax.patch.set_alpha(None)
+        fig.savefig(filename_svg, bbox_inches=Bbox.from_extents(*_CROP_INCHES), facecolor='white')
+        print(f"✓ Vector version saved as: {filename_svg}")
+    
+    # Show the plot, or release the figure in batch runs
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
     
     return filename
 
 def main():
     """Main function to create the visualization."""
+    parser = argparse.ArgumentParser(description="Render the 3D frame visualization to PNG.")
+    parser.add_argument("--dpi", type=int, default=150,
+                        help="render resolution (default: 150; 300 takes about 4x longer)")
+    parser.add_argument("--upscale", type=int, default=1,
+                        help="enlarge the render by this integer factor, e.g. 2 for 300-dpi-sized output from a 150 dpi render")
+    parser.add_argument("--no-gui", action="store_true",
+                        help="only write the PNGs; skip loading a window backend and showing the plot")
+    parser.add_argument("--svg", action="store_true",
+                        help="also write a scalable SVG copy of the visualization")
+    args = parser.parse_args()
+    
+    # Agg never loads a windowing toolkit
+    if args.no_gui:
+        matplotlib.use('Agg')
+    
     try:
-        filename = save_visualization()
+        filename = save_visualization(dpi=args.dpi, upscale=args.upscale, show=not args.no_gui, svg=args.svg)
         print(f"\n🎉 Frame visualization complete!")
         print(f"📁 Files created:")
         print(f"   • {filename}")
         print(f"   • stainless_steel_frame_visualization_transparent.png")
+        if args.svg:
+            print(f"   • stainless_steel_frame_visualization.svg")
         print(f"\nThe visualization shows your 48\" x 24\" stainless steel frame")
         print(f"with 2\" OD tubes in full 3D detail!")
         